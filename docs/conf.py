@@ -3,14 +3,14 @@ Sphinx configuration file for the project documentation.
 """
 import os
 import sys
-from datetime import datetime
 
 # Add the project root directory to the Python path
 sys.path.insert(0, os.path.abspath(".."))
 
 # Project information
 project = "AI-Powered Project"
-copyright = f"{datetime.now().year}, Your Name"
+# Static so the config (and Sphinx's environment cache) doesn't change by date
+copyright = "2024, Your Name"
 author = "Your Name"
 release = "0.1.0"
 
@@ -24,10 +24,17 @@ extensions = [
     "sphinx.ext.coverage",
     "sphinx_rtd_theme",
     "sphinx_autodoc_typehints",
-    "sphinx_design",
-    "myst_parser",
+    "sphinx.ext.ifconfig",
+    "sphinx.ext.githubpages",
 ]
 
+# DOCS_FAST=1 skips generating highlighted source pages (e.g. for CI checks)
+if os.environ.get("DOCS_FAST", "").lower() in {"1", "true", "yes"}:
+    extensions = [e for e in extensions if e != "sphinx.ext.viewcode"]
+
+viewcode_enable_epub = False
+viewcode_follow_imported_members = False
+
 templates_path = ["_templates"]
 exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 
@@ -37,15 +44,18 @@ html_static_path = ["_static"]
 html_css_files = [
     "custom.css",
 ]
+# Don't copy reST sources into the output; fewer files to write per build
+html_copy_source = False
+html_show_sourcelink = False
 
 # Intersphinx mapping
+# Only Python is cross-referenced. The inventory is read from _inventories/
+# (fetched once, see the build instructions) and downloaded only if missing.
 intersphinx_mapping = {
-    "python": ("https://docs.python.org/3", None),
-    "numpy": ("https://numpy.org/doc/stable/", None),
-    "pandas": ("https://pandas.pydata.org/docs/", None),
-    "scikit-learn": ("https://scikit-learn.org/stable/", None),
-    "torch": ("https://pytorch.org/docs/stable/", None),
-    "tensorflow": ("https://www.tensorflow.org/api_docs/python", None),
+    "python": (
+        "https://docs.python.org/3",
+        ("_inventories/python.inv", None),
+    ),
 }
 
 # Napoleon settings
@@ -62,20 +72,6 @@ napoleon_use_param = True
 napoleon_use_rtype = True
 napoleon_type_aliases = None
 
-# MyST settings
-myst_enable_extensions = [
-    "colon_fence",
-    "deflist",
-    "dollarmath",
-    "fieldlist",
-    "html_admonition",
-    "html_image",
-    "replacements",
-    "smartquotes",
-    "substitution",
-    "tasklist",
-]
-
 # Autodoc settings
 autodoc_default_options = {
     "members": True,
@@ -84,8 +80,3 @@ autodoc_default_options = {
     "undoc-members": True,
     "exclude-members": "__weakref__",
 }
-
-# Add any Sphinx extension module names here, as strings
-extensions.append("sphinx.ext.ifconfig")
-extensions.append("sphinx.ext.viewcode")
-extensions.append("sphinx.ext.githubpages") 
\ No newline at end of file
@@ -2,10 +2,20 @@
 Configuration management for the AI-powered project.
 """
 import os
-from typing import Optional
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, cast
+from urllib.parse import quote
 
-from pydantic import BaseSettings, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, ValidationInfo, field_validator
 from pydantic.networks import PostgresDsn, RedisDsn
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
 from .types import (
     CacheConfig,
@@ -16,9 +26,57 @@ from .types import (
     SecurityConfig,
 )
 
+_ConfigT = TypeVar("_ConfigT", bound=BaseModel)
+
+# Sentinel for an ``_env_file`` init argument that wasn't given
+_UNSET: Any = object()
+
+# Parsed env files, keyed by the files and parse options; each is read once
+_ENV_CACHE: dict[tuple[Any, ...], Mapping[str, Optional[str]]] = {}
+
+# Env file requested by the Settings instance currently being built
+_env_file_in_use: ContextVar[Any] = ContextVar("_env_file_in_use", default=_UNSET)
+
+def _parse_env_files(
+    source: DotEnvSettingsSource, env_file: Any
+) -> Mapping[str, Optional[str]]:
+    """Parse env files with the same options as ``source``."""
+    return DotEnvSettingsSource(
+        source.settings_cls,
+        env_file=env_file,
+        env_file_encoding=source.env_file_encoding,
+        case_sensitive=source.case_sensitive,
+        env_ignore_empty=source.env_ignore_empty,
+        env_parse_none_str=source.env_parse_none_str,
+    ).env_vars
+
+def _load_env_files(source: DotEnvSettingsSource, env_file: Any) -> None:
+    """Point a dotenv source at ``env_file``, reusing previously parsed files."""
+    source.env_file = env_file
+    if env_file is None:
+        source.env_vars = {}
+        return
+    files = env_file if isinstance(env_file, (list, tuple)) else [env_file]
+    key = (
+        tuple(os.path.abspath(os.fspath(f)) for f in files),
+        source.env_file_encoding,
+        source.case_sensitive,
+        source.env_ignore_empty,
+        source.env_parse_none_str,
+    )
+    if key not in _ENV_CACHE:
+        _ENV_CACHE[key] = _parse_env_files(source, env_file)
+    source.env_vars = _ENV_CACHE[key]
+
 class Settings(BaseSettings):
     """Application settings."""
     
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=".env",
+        env_file_encoding="utf-8",
+    )
+    
     # Application
     APP_NAME: str = "AI-Powered Project"
     APP_ENV: str = "development"
@@ -26,7 +84,7 @@ class Settings(BaseSettings):
     API_V1_PREFIX: str = "/api/v1"
     
     # Security
-    SECRET_KEY: str = Field(..., env="SECRET_KEY")
+    SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
@@ -34,24 +92,24 @@ class Settings(BaseSettings):
     CORS_ORIGINS: list[str] = Field(default_factory=list)
     
     # Database
-    POSTGRES_SERVER: str = Field(..., env="POSTGRES_SERVER")
-    POSTGRES_USER: str = Field(..., env="POSTGRES_USER")
-    POSTGRES_PASSWORD: str = Field(..., env="POSTGRES_PASSWORD")
-    POSTGRES_DB: str = Field(..., env="POSTGRES_DB")
-    POSTGRES_PORT: str = Field(..., env="POSTGRES_PORT")
-    SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
+    POSTGRES_SERVER: str
+    POSTGRES_USER: str
+    POSTGRES_PASSWORD: str
+    POSTGRES_DB: str
+    POSTGRES_PORT: str
+    SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = Field(None, validate_default=True)
     
     # Redis
-    REDIS_HOST: str = Field(..., env="REDIS_HOST")
-    REDIS_PORT: int = Field(..., env="REDIS_PORT")
-    REDIS_PASSWORD: Optional[str] = Field(None, env="REDIS_PASSWORD")
+    REDIS_HOST: str
+    REDIS_PORT: int
+    REDIS_PASSWORD: Optional[str] = None
     REDIS_DB: int = 0
-    REDIS_URI: Optional[RedisDsn] = None
+    REDIS_URI: Optional[RedisDsn] = Field(None, validate_default=True)
     
     # AI Models
-    OPENAI_API_KEY: str = Field(..., env="OPENAI_API_KEY")
-    ANTHROPIC_API_KEY: Optional[str] = Field(None, env="ANTHROPIC_API_KEY")
-    GOOGLE_API_KEY: Optional[str] = Field(None, env="GOOGLE_API_KEY")
+    OPENAI_API_KEY: str
+    ANTHROPIC_API_KEY: Optional[str] = None
+    GOOGLE_API_KEY: Optional[str] = None
     
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -69,93 +127,207 @@ class Settings(BaseSettings):
     METRICS_PORT: int = 9090
     METRICS_PATH: str = "/metrics"
     
-    @validator("SQLALCHEMY_DATABASE_URI", pre=True)
-    def assemble_db_connection(cls, v: Optional[str], values: dict[str, any]) -> PostgresDsn:
+    # Derived config models, built on first use; cleared when a field changes
+    _config_cache: dict[str, BaseModel] = PrivateAttr(default_factory=dict)
+    
+    def __init__(self, **values: Any) -> None:
+        env_file = values.pop("_env_file", _UNSET)
+        if env_file is _UNSET:
+            env_file = type(self).model_config.get("env_file")
+        # The dotenv source is built without a file and filled from the cache
+        # in settings_customise_sources, so the file isn't parsed every time
+        token = _env_file_in_use.set(env_file)
+        try:
+            super().__init__(_env_file=None, **values)
+        finally:
+            _env_file_in_use.reset(token)
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Serve the ``.env`` file from the parsed-file cache."""
+        env_file = _env_file_in_use.get()
+        if env_file is not _UNSET and isinstance(dotenv_settings, DotEnvSettingsSource):
+            _load_env_files(dotenv_settings, env_file)
+        return init_settings, env_settings, dotenv_settings, file_secret_settings
+    
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Settings":
+        """Copy the settings without the derived config cache."""
+        copy = super().model_copy(update=update, deep=deep)
+        copy._config_cache = {}
+        return copy
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._config_cache.clear()
+    
+    def _cached_config(self, key: str, build: Callable[[], _ConfigT]) -> _ConfigT:
+        """Return the derived config model ``key``, building it on first use."""
+        if key not in self._config_cache:
+            self._config_cache[key] = build()
+        return cast(_ConfigT, self._config_cache[key])
+    
+    @field_validator("SQLALCHEMY_DATABASE_URI", mode="before")
+    @classmethod
+    def assemble_db_connection(cls, v: Optional[str], info: ValidationInfo) -> Any:
         """Assemble database connection string."""
         if isinstance(v, str):
             return v
-        return PostgresDsn.build(
-            scheme="postgresql",
-            username=values.get("POSTGRES_USER"),
-            password=values.get("POSTGRES_PASSWORD"),
-            host=values.get("POSTGRES_SERVER"),
-            port=values.get("POSTGRES_PORT"),
-            path=f"/{values.get('POSTGRES_DB') or ''}",
+        values = info.data
+        user = quote(values.get("POSTGRES_USER") or "", safe="")
+        password = quote(values.get("POSTGRES_PASSWORD") or "", safe="")
+        return (
+            f"postgresql://{user}:{password}@{values.get('POSTGRES_SERVER')}"
+            f":{values.get('POSTGRES_PORT')}/{values.get('POSTGRES_DB') or ''}"
         )
     
-    @validator("REDIS_URI", pre=True)
-    def assemble_redis_connection(cls, v: Optional[str], values: dict[str, any]) -> RedisDsn:
+    @field_validator("REDIS_URI", mode="before")
+    @classmethod
+    def assemble_redis_connection(cls, v: Optional[str], info: ValidationInfo) -> Any:
         """Assemble Redis connection string."""
         if isinstance(v, str):
             return v
-        return RedisDsn.build(
-            scheme="redis",
-            host=values.get("REDIS_HOST"),
-            port=values.get("REDIS_PORT"),
-            password=values.get("REDIS_PASSWORD"),
-            path=f"/{values.get('REDIS_DB') or '0'}",
+        values = info.data
+        password = values.get("REDIS_PASSWORD")
+        auth = f":{quote(password, safe='')}@" if password else ""
+        return (
+            f"redis://{auth}{values.get('REDIS_HOST')}:{values.get('REDIS_PORT')}"
+            f"/{values.get('REDIS_DB') or 0}"
+        )
+    
+    @property
+    def database_config(self) -> DatabaseConfig:
+        """Database configuration (cached until a field changes)."""
+        return self._cached_config(
+            "database",
+            lambda: DatabaseConfig(
+                host=self.POSTGRES_SERVER,
+                port=int(self.POSTGRES_PORT),
+                database=self.POSTGRES_DB,
+                user=self.POSTGRES_USER,
+                password=self.POSTGRES_PASSWORD,
+            ),
         )
     
     def get_database_config(self) -> DatabaseConfig:
         """Get database configuration."""
-        return DatabaseConfig(
-            host=self.POSTGRES_SERVER,
-            port=int(self.POSTGRES_PORT),
-            database=self.POSTGRES_DB,
-            user=self.POSTGRES_USER,
-            password=self.POSTGRES_PASSWORD,
+        return self.database_config
+    
+    @property
+    def cache_config(self) -> CacheConfig:
+        """Cache configuration (cached until a field changes)."""
+        return self._cached_config(
+            "cache",
+            lambda: CacheConfig(
+                host=self.REDIS_HOST,
+                port=self.REDIS_PORT,
+                password=self.REDIS_PASSWORD,
+                db=self.REDIS_DB,
+            ),
         )
     
     def get_cache_config(self) -> CacheConfig:
         """Get cache configuration."""
-        return CacheConfig(
-            host=self.REDIS_HOST,
-            port=self.REDIS_PORT,
-            password=self.REDIS_PASSWORD,
-            db=self.REDIS_DB,
+        return self.cache_config
+    
+    @property
+    def log_config(self) -> LogConfig:
+        """Logging configuration (cached until a field changes)."""
+        return self._cached_config(
+            "log",
+            lambda: LogConfig(
+                level=self.LOG_LEVEL,
+                format=self.LOG_FORMAT,
+                file=self.LOG_FILE,
+            ),
         )
     
     def get_log_config(self) -> LogConfig:
         """Get logging configuration."""
-        return LogConfig(
-            level=self.LOG_LEVEL,
-            format=self.LOG_FORMAT,
-            file=self.LOG_FILE,
+        return self.log_config
+    
+    @property
+    def security_config(self) -> SecurityConfig:
+        """Security configuration (cached until a field changes)."""
+        return self._cached_config(
+            "security",
+            lambda: SecurityConfig(
+                secret_key=self.SECRET_KEY,
+                algorithm=self.ALGORITHM,
+                access_token_expire_minutes=self.ACCESS_TOKEN_EXPIRE_MINUTES,
+                refresh_token_expire_days=self.REFRESH_TOKEN_EXPIRE_DAYS,
+                allowed_hosts=self.ALLOWED_HOSTS,
+                cors_origins=self.CORS_ORIGINS,
+            ),
         )
     
     def get_security_config(self) -> SecurityConfig:
         """Get security configuration."""
-        return SecurityConfig(
-            secret_key=self.SECRET_KEY,
-            algorithm=self.ALGORITHM,
-            access_token_expire_minutes=self.ACCESS_TOKEN_EXPIRE_MINUTES,
-            refresh_token_expire_days=self.REFRESH_TOKEN_EXPIRE_DAYS,
-            allowed_hosts=self.ALLOWED_HOSTS,
-            cors_origins=self.CORS_ORIGINS,
+        return self.security_config
+    
+    @property
+    def rate_limit_config(self) -> RateLimitConfig:
+        """Rate limiting configuration (cached until a field changes)."""
+        return self._cached_config(
+            "rate_limit",
+            lambda: RateLimitConfig(
+                enabled=self.RATE_LIMIT_ENABLED,
+                requests_per_minute=self.RATE_LIMIT_REQUESTS,
+                burst_size=self.RATE_LIMIT_BURST,
+                storage=self.RATE_LIMIT_STORAGE,
+            ),
         )
     
     def get_rate_limit_config(self) -> RateLimitConfig:
         """Get rate limiting configuration."""
-        return RateLimitConfig(
-            enabled=self.RATE_LIMIT_ENABLED,
-            requests_per_minute=self.RATE_LIMIT_REQUESTS,
-            burst_size=self.RATE_LIMIT_BURST,
-            storage=self.RATE_LIMIT_STORAGE,
+        return self.rate_limit_config
+    
+    @property
+    def metrics_config(self) -> MetricsConfig:
+        """Metrics configuration (cached until a field changes)."""
+        return self._cached_config(
+            "metrics",
+            lambda: MetricsConfig(
+                enabled=self.METRICS_ENABLED,
+                port=self.METRICS_PORT,
+                path=self.METRICS_PATH,
+            ),
         )
     
     def get_metrics_config(self) -> MetricsConfig:
         """Get metrics configuration."""
-        return MetricsConfig(
-            enabled=self.METRICS_ENABLED,
-            port=self.METRICS_PORT,
-            path=self.METRICS_PATH,
-        )
-    
-    class Config:
-        """Pydantic configuration."""
-        case_sensitive = True
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+        return self.metrics_config
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the global settings instance, creating it on first access."""
+    return Settings()
+
+def clear_env_cache() -> None:
+    """Forget parsed env files so the next ``Settings()`` re-reads them."""
+    _ENV_CACHE.clear()
+
+def reload_settings() -> Settings:
+    """Re-read the env files and rebuild the global settings instance."""
+    clear_env_cache()
+    get_settings.cache_clear()
+    return get_settings()
+
+if TYPE_CHECKING:
+    settings: Settings
 
-# Create global settings instance
-settings = Settings() 
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """Resolve the module-level ``settings`` attribute lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+ 
\ No newline at end of file
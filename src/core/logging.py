@@ -5,10 +5,60 @@ import logging
 import logging.config
 import logging.handlers
 import os
+from functools import cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-from ..config import settings
+from ..config import get_settings
+
+_DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_DEV_FORMAT = (
+    "%(asctime)s - %(name)s - %(levelname)s - "
+    "%(pathname)s:%(funcName)s:%(lineno)d - %(message)s"
+)
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+@cache
+def _make_formatter(fmt: str, datefmt: str = _DATE_FORMAT) -> logging.Formatter:
+    """Return a shared formatter for the given format strings."""
+    return logging.Formatter(fmt, datefmt, style="%", validate=True)
+
+# Static parts of the logging configuration; get_logging_config only patches
+# the level, format and file handler on top of this template.
+_BASE_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "()": _make_formatter,
+            "fmt": _DEFAULT_FORMAT,
+            "datefmt": _DATE_FORMAT
+        },
+        "dev": {
+            "()": _make_formatter,
+            "fmt": _DEV_FORMAT,
+            "datefmt": _DATE_FORMAT
+        }
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "level": "INFO",
+            "formatter": "default",
+            "stream": "ext://sys.stdout"
+        }
+    },
+    "root": {
+        "level": "INFO",
+        "handlers": ["console"]
+    }
+}
+
+def _ensure_log_dir(log_dir: Path) -> None:
+    """Create the log directory if it doesn't exist."""
+    # A single stat in the common case; mkdir only when the directory is missing
+    if not os.path.isdir(log_dir):
+        os.makedirs(log_dir, exist_ok=True)
 
 def get_logging_config(
     log_level: str = "INFO",
@@ -33,24 +83,12 @@ def get_logging_config(
         Logging configuration dictionary
     """
     config = {
-        "version": 1,
-        "disable_existing_loggers": False,
-        "formatters": {
-            "default": {
-                "format": log_format or "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S"
-            },
-            "dev": {
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(pathname)s:%(funcName)s:%(lineno)d - %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S"
-            }
-        },
+        **_BASE_CONFIG,
         "handlers": {
             "console": {
-                "class": "logging.StreamHandler",
+                **_BASE_CONFIG["handlers"]["console"],
                 "level": log_level,
-                "formatter": "dev" if is_development else "default",
-                "stream": "ext://sys.stdout"
+                "formatter": "dev" if is_development else "default"
             }
         },
         "root": {
@@ -59,10 +97,19 @@ def get_logging_config(
         }
     }
     
+    if log_format and log_format != _DEFAULT_FORMAT:
+        config["formatters"] = {
+            **_BASE_CONFIG["formatters"],
+            "default": {
+                "()": _make_formatter,
+                "fmt": log_format,
+                "datefmt": _DATE_FORMAT
+            }
+        }
+    
     if log_file:
         # Create logs directory if it doesn't exist
-        log_dir = Path(log_file).parent
-        log_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_log_dir(Path(log_file).parent)
         
         config["handlers"]["file"] = {
             "class": "logging.handlers.RotatingFileHandler",
@@ -76,6 +123,9 @@ def get_logging_config(
     
     return config
 
+# "configured" is set once setup_logging has configured logging successfully
+_state: Dict[str, bool] = {"configured": False}
+
 def setup_logging(
     log_level: str = "INFO",
     log_format: Optional[str] = None,
@@ -88,6 +138,8 @@ def setup_logging(
     """
     Configure logging for the application.
     
+    Logging is configured once per process; subsequent calls are no-ops.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_format: Log message format
@@ -97,13 +149,16 @@ def setup_logging(
         config_file: Path to logging configuration file
         is_development: Whether to use development formatter (defaults to APP_ENV == "development")
     """
+    if _state["configured"]:
+        return
+
     if config_file and os.path.exists(config_file):
         # Use configuration file if provided
         logging.config.fileConfig(config_file)
     else:
         # Use programmatic configuration
         if is_development is None:
-            is_development = settings.APP_ENV == "development"
+            is_development = get_settings().APP_ENV == "development"
         
         config = get_logging_config(
             log_level=log_level,
@@ -115,6 +170,8 @@ def setup_logging(
         )
         logging.config.dictConfig(config)
     
+    _state["configured"] = True
+    
     # Log initial message
     logging.info("Logging configured successfully")
 
@@ -129,10 +186,3 @@ def get_logger(name: str) -> logging.Logger:
         Logger instance
     """
     return logging.getLogger(name)
-
-# Configure logging on module import
-setup_logging(
-    log_level=settings.LOG_LEVEL,
-    log_format=settings.LOG_FORMAT,
-    log_file=settings.LOG_FILE
-) 
\ No newline at end of file
@@ -2,7 +2,9 @@
 Type definitions for the AI-powered project.
 """
 from typing import (
+    Annotated,
     Any,
+    ClassVar,
     Dict,
     List,
     Literal,
@@ -15,7 +17,7 @@ from typing import (
     runtime_checkable,
 )
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Basic Types
 JSON: TypeAlias = Dict[str, Any]
@@ -39,6 +41,8 @@ ModelProvider: TypeAlias = Literal["openai", "anthropic", "google"]
 # API Types
 class APIResponse(BaseModel):
     """Base API response model."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool = Field(..., description="Whether the request was successful")
     message: Optional[str] = Field(None, description="Response message")
     data: Optional[Any] = Field(None, description="Response data")
@@ -46,6 +50,8 @@ class APIResponse(BaseModel):
 
 class PaginationParams(BaseModel):
     """Pagination parameters."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     page: int = Field(1, ge=1, description="Page number")
     page_size: int = Field(10, ge=1, le=100, description="Items per page")
     total: Optional[int] = Field(None, description="Total number of items")
@@ -55,20 +61,30 @@ class PaginatedResponse(APIResponse):
     pagination: PaginationParams
 
 # AI Request/Response Types
+# Constrained types shared by the AI request fields
+PromptText: TypeAlias = Annotated[str, Field(max_length=4000)]
+UnitInterval: TypeAlias = Annotated[float, Field(ge=0.0, le=1.0)]
+Penalty: TypeAlias = Annotated[float, Field(ge=-2.0, le=2.0)]
+TokenCount: TypeAlias = Annotated[int, Field(ge=1, le=4000)]
+
 class AIRequest(BaseModel):
     """Base AI request model."""
-    prompt: str = Field(..., min_length=1, max_length=4000)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    prompt: Annotated[PromptText, Field(min_length=1)]
     model: ModelName = Field(..., description="AI model to use")
-    temperature: float = Field(0.7, ge=0.0, le=1.0)
-    max_tokens: Optional[int] = Field(None, ge=1, le=4000)
-    top_p: float = Field(1.0, ge=0.0, le=1.0)
-    frequency_penalty: float = Field(0.0, ge=-2.0, le=2.0)
-    presence_penalty: float = Field(0.0, ge=-2.0, le=2.0)
-    stop: Optional[List[str]] = Field(None, max_items=4)
-    system_message: Optional[str] = Field(None, max_length=4000)
+    temperature: UnitInterval = 0.7
+    max_tokens: Optional[TokenCount] = None
+    top_p: UnitInterval = 1.0
+    frequency_penalty: Penalty = 0.0
+    presence_penalty: Penalty = 0.0
+    stop: Optional[Annotated[List[str], Field(max_length=4)]] = None
+    system_message: Optional[PromptText] = None
 
 class AIResponse(BaseModel):
     """Base AI response model."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     text: str = Field(..., description="Generated text")
     model: ModelName = Field(..., description="Model used")
     usage: Dict[str, int] = Field(..., description="Token usage")
@@ -102,6 +118,8 @@ class AsyncDataProcessor(Protocol):
 # Database Types
 class DatabaseConfig(BaseModel):
     """Database configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     host: str
     port: int
     database: str
@@ -114,6 +132,8 @@ class DatabaseConfig(BaseModel):
 # Cache Types
 class CacheConfig(BaseModel):
     """Cache configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     host: str
     port: int
     db: int = 0
@@ -123,6 +143,8 @@ class CacheConfig(BaseModel):
 # Logging Types
 class LogConfig(BaseModel):
     """Logging configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     level: str = "INFO"
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     file: Optional[str] = None
@@ -132,6 +154,8 @@ class LogConfig(BaseModel):
 # Security Types
 class SecurityConfig(BaseModel):
     """Security configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
@@ -142,6 +166,8 @@ class SecurityConfig(BaseModel):
 # Rate Limiting Types
 class RateLimitConfig(BaseModel):
     """Rate limiting configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     enabled: bool = True
     requests_per_minute: int = 60
     burst_size: int = 10
@@ -150,6 +176,8 @@ class RateLimitConfig(BaseModel):
 # Monitoring Types
 class MetricsConfig(BaseModel):
     """Metrics configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     enabled: bool = True
     port: int = 9090
     path: str = "/metrics"
@@ -158,45 +186,62 @@ class MetricsConfig(BaseModel):
 # Error Types
 class APIError(Exception):
     """Base API error."""
+    default_message: ClassVar[str] = "Internal server error"
+    default_status_code: ClassVar[int] = 500
+
     def __init__(
         self,
-        message: str,
-        status_code: int = 500,
+        message: Optional[str] = None,
+        status_code: Optional[int] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        self.message = message
-        self.status_code = status_code
+        self.message = self.default_message if message is None else message
+        self.status_code = (
+            self.default_status_code if status_code is None else status_code
+        )
         self.details = details or {}
-        super().__init__(message)
+        super().__init__(self.message)
+
+class _FixedStatusError(APIError):
+    """API error whose status code is set by the class."""
+
+    def __init__(
+        self,
+        message: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(message, details=details)
 
-class ValidationError(APIError):
+class ValidationError(_FixedStatusError):
     """Validation error."""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(message, 422, details)
+    default_message = "Validation failed"
+    default_status_code = 422
 
-class AuthenticationError(APIError):
+class AuthenticationError(_FixedStatusError):
     """Authentication error."""
-    def __init__(self, message: str = "Authentication failed"):
-        super().__init__(message, 401)
+    default_message = "Authentication failed"
+    default_status_code = 401
 
-class AuthorizationError(APIError):
+class AuthorizationError(_FixedStatusError):
     """Authorization error."""
-    def __init__(self, message: str = "Not authorized"):
-        super().__init__(message, 403)
+    default_message = "Not authorized"
+    default_status_code = 403
 
-class NotFoundError(APIError):
+class NotFoundError(_FixedStatusError):
     """Not found error."""
-    def __init__(self, message: str = "Resource not found"):
-        super().__init__(message, 404)
+    default_message = "Resource not found"
+    default_status_code = 404
 
-class RateLimitError(APIError):
+class RateLimitError(_FixedStatusError):
     """Rate limit error."""
-    def __init__(self, message: str = "Rate limit exceeded"):
-        super().__init__(message, 429)
+    default_message = "Rate limit exceeded"
+    default_status_code = 429
 
 # Utility Types
 class TimestampedModel(BaseModel):
     """Base model with timestamps."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     created_at: int = Field(..., description="Creation timestamp")
     updated_at: int = Field(..., description="Last update timestamp")
 
@@ -205,20 +250,13 @@ class IDModel(TimestampedModel):
     id: str = Field(..., description="Unique identifier")
 
 # Type Guards
+_JSON_TYPES = (dict, list, str, int, float, bool, type(None))
+_NUMBER_TYPES = (int, float)
+
 def is_valid_json(value: Any) -> bool:
     """Check if value is valid JSON."""
-    try:
-        if isinstance(value, (dict, list, str, int, float, bool, type(None))):
-            return True
-        return False
-    except Exception:
-        return False
+    return isinstance(value, _JSON_TYPES)
 
 def is_valid_timestamp(value: Any) -> bool:
     """Check if value is a valid timestamp."""
-    try:
-        if isinstance(value, (int, float)) and value > 0:
-            return True
-        return False
-    except Exception:
-        return False 
\ No newline at end of file
+    return isinstance(value, _NUMBER_TYPES) and value > 0
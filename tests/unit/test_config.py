@@ -0,0 +1,161 @@
+"""
+Tests for the application settings.
+"""
+from unittest import mock
+
+import pytest
+from pydantic import ValidationError
+
+from src import config
+from src.config import Settings
+
+REQUIRED_ENV = {
+    "SECRET_KEY": "secret",
+    "POSTGRES_SERVER": "db",
+    "POSTGRES_USER": "user",
+    "POSTGRES_PASSWORD": "password",
+    "POSTGRES_DB": "app",
+    "POSTGRES_PORT": "5432",
+    "REDIS_HOST": "redis",
+    "REDIS_PORT": "6379",
+}
+
+
+AI_KEYS = ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY")
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch, tmp_path):
+    """Run every test in an empty directory with only the required settings set."""
+    monkeypatch.chdir(tmp_path)
+    config.clear_env_cache()
+    for name in AI_KEYS:
+        monkeypatch.delenv(name, raising=False)
+    for name, value in REQUIRED_ENV.items():
+        monkeypatch.setenv(name, value)
+    yield monkeypatch
+    config.get_settings.cache_clear()
+
+
+def test_missing_required_key_fails_at_startup():
+    with pytest.raises(ValidationError, match="OPENAI_API_KEY"):
+        Settings()
+
+
+def test_key_from_environment(env):
+    env.setenv("OPENAI_API_KEY", "envkey")
+
+    assert Settings().OPENAI_API_KEY == "envkey"
+
+
+def test_key_from_dotenv(tmp_path):
+    (tmp_path / ".env").write_text("OPENAI_API_KEY=dotenvkey\n")
+
+    assert Settings().OPENAI_API_KEY == "dotenvkey"
+
+
+def test_environment_takes_precedence_over_dotenv(env, tmp_path):
+    (tmp_path / ".env").write_text("OPENAI_API_KEY=dotenvkey\n")
+    env.setenv("OPENAI_API_KEY", "envkey")
+
+    assert Settings().OPENAI_API_KEY == "envkey"
+
+
+def test_init_kwarg_overrides_environment(env):
+    env.setenv("OPENAI_API_KEY", "envkey")
+
+    assert Settings(OPENAI_API_KEY="initkey").OPENAI_API_KEY == "initkey"
+
+
+def test_env_file_override(env, tmp_path):
+    (tmp_path / ".env").write_text("POSTGRES_SERVER=db1\nOPENAI_API_KEY=dotenvkey\n")
+    (tmp_path / "other.env").write_text(
+        "POSTGRES_SERVER=db2\nOPENAI_API_KEY=otherkey\n"
+    )
+    env.delenv("POSTGRES_SERVER")
+
+    settings = Settings(_env_file="other.env")
+
+    assert settings.POSTGRES_SERVER == "db2"
+    assert settings.OPENAI_API_KEY == "otherkey"
+
+
+def test_env_prefix_override(env):
+    env.setenv("APP_OPENAI_API_KEY", "prefixedkey")
+    for name, value in REQUIRED_ENV.items():
+        env.setenv(f"APP_{name}", value)
+
+    assert Settings(_env_prefix="APP_").OPENAI_API_KEY == "prefixedkey"
+
+
+def test_model_dump_and_iteration_follow_field_order(env):
+    env.setenv("OPENAI_API_KEY", "envkey")
+    settings = Settings()
+
+    assert settings.model_dump()["OPENAI_API_KEY"] == "envkey"
+    assert list(settings.model_dump()) == list(Settings.model_fields)
+    assert list(dict(settings)) == list(Settings.model_fields)
+
+
+def test_derived_config_is_cached(env):
+    env.setenv("OPENAI_API_KEY", "envkey")
+    settings = Settings()
+
+    assert settings.get_database_config() is settings.get_database_config()
+    assert list(dict(settings)) == list(Settings.model_fields)
+
+
+def test_model_copy_rebuilds_derived_config(env):
+    env.setenv("OPENAI_API_KEY", "envkey")
+    settings = Settings()
+    assert settings.get_database_config().host == "db"
+
+    copy = settings.model_copy(update={"POSTGRES_SERVER": "other"})
+
+    assert copy.get_database_config().host == "other"
+    assert settings.get_database_config().host == "db"
+
+
+def test_assignment_rebuilds_derived_config(env):
+    env.setenv("OPENAI_API_KEY", "envkey")
+    settings = Settings()
+    assert settings.get_cache_config().host == "redis"
+
+    settings.REDIS_HOST = "other"
+
+    assert settings.get_cache_config().host == "other"
+
+
+def test_reload_settings_rereads_dotenv(tmp_path):
+    (tmp_path / ".env").write_text("OPENAI_API_KEY=first\n")
+    assert config.reload_settings().OPENAI_API_KEY == "first"
+
+    (tmp_path / ".env").write_text("OPENAI_API_KEY=second\n")
+    assert config.get_settings().OPENAI_API_KEY == "first"
+    assert config.reload_settings().OPENAI_API_KEY == "second"
+
+
+def test_dotenv_is_parsed_once(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text("OPENAI_API_KEY=dotenvkey\n")
+    parse = mock.Mock(wraps=config._parse_env_files)
+    monkeypatch.setattr(config, "_parse_env_files", parse)
+
+    first, second = Settings(), Settings()
+
+    assert parse.call_count == 1
+    assert first.OPENAI_API_KEY == second.OPENAI_API_KEY == "dotenvkey"
+
+
+def test_env_file_list_and_case_insensitive_are_cached(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text("OPENAI_API_KEY=dotenvkey\n")
+    (tmp_path / "other.env").write_text("GOOGLE_API_KEY=googlekey\n")
+    parse = mock.Mock(wraps=config._parse_env_files)
+    monkeypatch.setattr(config, "_parse_env_files", parse)
+
+    for _ in range(2):
+        settings = Settings(_env_file=[".env", "other.env"])
+        assert settings.OPENAI_API_KEY == "dotenvkey"
+        assert settings.GOOGLE_API_KEY == "googlekey"
+        Settings(_case_sensitive=False)
+
+    assert parse.call_count == 2
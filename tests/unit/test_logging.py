@@ -0,0 +1,56 @@
+"""
+Tests for the logging configuration.
+"""
+import logging
+
+import pytest
+
+from src.core import logging as app_logging
+
+
+@pytest.fixture(autouse=True)
+def reset_configured(monkeypatch):
+    """Start every test with logging unconfigured."""
+    monkeypatch.setitem(app_logging._state, "configured", False)
+
+
+def test_setup_logging_is_idempotent(monkeypatch):
+    calls = []
+    monkeypatch.setattr(logging.config, "dictConfig", calls.append)
+
+    app_logging.setup_logging(is_development=False)
+    app_logging.setup_logging(is_development=False)
+
+    assert len(calls) == 1
+
+
+def test_setup_logging_can_be_retried_after_failure(monkeypatch):
+    with pytest.raises(ValueError):
+        app_logging.setup_logging(log_level="NOPE", is_development=False)
+    assert app_logging._state["configured"] is False
+
+    calls = []
+    monkeypatch.setattr(logging.config, "dictConfig", calls.append)
+    app_logging.setup_logging(log_level="INFO", is_development=False)
+
+    assert len(calls) == 1
+    assert app_logging._state["configured"] is True
+
+
+def test_get_logging_config_recreates_deleted_log_dir(tmp_path):
+    log_file = tmp_path / "logs" / "app.log"
+
+    app_logging.get_logging_config(log_file=str(log_file))
+    assert log_file.parent.is_dir()
+
+    log_file.parent.rmdir()
+    config = app_logging.get_logging_config(log_file=str(log_file))
+
+    assert log_file.parent.is_dir()
+    assert config["handlers"]["file"]["filename"] == str(log_file)
+
+
+def test_invalid_log_format_is_rejected_at_setup():
+    with pytest.raises(ValueError):
+        app_logging.setup_logging(log_format="%(bogus", is_development=False)
+    assert app_logging._state["configured"] is False
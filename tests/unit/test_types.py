@@ -0,0 +1,55 @@
+"""
+Tests for the shared types.
+"""
+import pytest
+
+from src.types import (
+    APIError,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ValidationError,
+)
+
+
+def test_api_error_defaults():
+    error = APIError()
+
+    assert error.message == "Internal server error"
+    assert error.status_code == 500
+    assert error.details == {}
+
+
+def test_api_error_keeps_explicit_zero_status():
+    assert APIError("custom", 0).status_code == 0
+
+
+@pytest.mark.parametrize(
+    ("error_cls", "status_code", "message"),
+    [
+        (ValidationError, 422, "Validation failed"),
+        (AuthenticationError, 401, "Authentication failed"),
+        (NotFoundError, 404, "Resource not found"),
+        (RateLimitError, 429, "Rate limit exceeded"),
+    ],
+)
+def test_subclass_defaults(error_cls, status_code, message):
+    error = error_cls()
+
+    assert isinstance(error, APIError)
+    assert error.status_code == status_code
+    assert error.message == message
+    assert str(error) == message
+
+
+def test_validation_error_details():
+    error = ValidationError("bad input", {"field": "name"})
+
+    assert error.message == "bad input"
+    assert error.details == {"field": "name"}
+
+
+def test_subclass_status_code_is_fixed():
+    with pytest.raises(TypeError):
+        NotFoundError("missing", details={}, status_code=500)
+    assert NotFoundError("missing", {"id": 1}).status_code == 404